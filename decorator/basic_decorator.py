@@ -176,6 +176,30 @@ def with_wrap(x):
     return x * 2
 
 
+def _fast_wraps(func, wrapper):
+    """只复制常用的元数据（__module__、__name__、__qualname__、__doc__、__wrapped__），
+    不复制 __annotations__ 等其余属性，也不合并 __dict__，比 wraps 更轻量"""
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def decorator_with_fast_wraps(func):
+    """手动复制元数据的装饰器（适合在导入时大量装饰函数的场景）"""
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return _fast_wraps(func, wrapper)
+
+
+@decorator_with_fast_wraps
+def with_fast_wrap(x):
+    """原函数 doc: 这是手动复制元数据的函数"""
+    return x * 2
+
+
 print("不使用 wraps 的情况:")
 print(f"  函数名: {no_wrap.__name__}")
 print(f"  文档: {no_wrap.__doc__}")
@@ -191,3 +215,9 @@ print(f"  文档: {with_wrap.__doc__}")
 print(f"  是否有 __wrapped__: {hasattr(with_wrap, '__wrapped__')}")
 print(f"  __wrapped__: {getattr(with_wrap, '__wrapped__', None)}")
 
+print("\n手动复制元数据的情况:")
+print(f"  函数名: {with_fast_wrap.__name__}")
+print(f"  限定名: {with_fast_wrap.__qualname__}")
+print(f"  文档: {with_fast_wrap.__doc__}")
+print(f"  是否有 __wrapped__: {hasattr(with_fast_wrap, '__wrapped__')}")
+print(f"  __wrapped__: {getattr(with_fast_wrap, '__wrapped__', None)}")
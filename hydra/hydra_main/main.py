@@ -1,18 +1,23 @@
 import hydra
 from hydra.core.hydra_config import HydraConfig
-from omegaconf import DictConfig  # Hydra 配置字典类型
+from omegaconf import DictConfig, OmegaConf  # Hydra 配置字典类型
 
 # 装饰器参数：config_path（配置目录）、config_name（默认配置文件名）
 @hydra.main(config_path="conf", config_name="default", version_base="1.3")
 def main(cfg: DictConfig) -> None:
-    # 访问配置（DictConfig 支持点语法）
+    # DictConfig 支持点语法（如 cfg.db.host），但每次访问都要走插值解析和类型转换；
+    # 频繁读取时先一次性转成普通 dict（resolve=True 会解析所有插值）
+    d = OmegaConf.to_container(cfg, resolve=True)
+    db = d["db"]
+    server = d["server"]
+
     print("数据库配置：")
-    print(f"  地址：{cfg.db.host}:{cfg.db.port}")
-    print(f"  账号：{cfg.db.username}/{cfg.db.password}")
+    print(f"  地址：{db['host']}:{db['port']}")
+    print(f"  账号：{db['username']}/{db['password']}")
     
     print("\n服务配置：")
-    print(f"  端口：{cfg.server.port}")
-    print(f"  调试模式：{cfg.server.debug}")
+    print(f"  端口：{server['port']}")
+    print(f"  调试模式：{server['debug']}")
     
     # 查看 Hydra 运行信息（如配置文件路径、命令行参数）
     print(f"\nHydra 配置路径：{HydraConfig.get().runtime.config_sources}")
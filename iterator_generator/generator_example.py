@@ -2,6 +2,7 @@
 Generator examples
 
 - Simple generator function (countdown)
+- Bulk countdown backed by a C-level range iterator (countdown_bulk)
 - Generator expression
 - Generator used with next(), send(), close()
 """
@@ -14,6 +15,16 @@ def countdown(n):
     print("generator countdown() finished")
 
 
+def countdown_bulk(n):
+    """Iterator over n..1 for consumers that drain it in one go.
+
+    Unlike countdown(), no generator frame is resumed per element; the
+    values come straight from a range iterator. Use countdown() when you
+    need the generator protocol (send(), close(), lazy side effects).
+    """
+    return iter(range(n, 0, -1))
+
+
 def demo_generator_function():
     print("-- demo_generator_function --")
     gen = countdown(3)
@@ -22,6 +33,7 @@ def demo_generator_function():
     print("for remaining in gen:")
     for v in gen:
         print("  ", v)
+    print("list(countdown_bulk(3)):", list(countdown_bulk(3)))
     print()
 
 
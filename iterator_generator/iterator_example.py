@@ -9,6 +9,9 @@ from typing import Iterator
 
 class CountUpIterator:
     """A simple stateful iterator that counts from 1..max_inclusive."""
+    # __slots__ keeps attribute access in __next__ off the instance __dict__
+    __slots__ = ("max", "current")
+
     def __init__(self, max_inclusive: int):
         self.max = max_inclusive
         self.current = 0
@@ -25,6 +28,8 @@ class CountUpIterator:
 
 class CountUpIterable:
     """An iterable that returns a fresh CountUpIterator on each __iter__ call."""
+    __slots__ = ("max",)
+
     def __init__(self, max_inclusive: int):
         self.max = max_inclusive
 
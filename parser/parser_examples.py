@@ -16,6 +16,7 @@ Argparse 使用示例（简洁、可直接运行）
 """
 
 import argparse
+import functools
 from argparse import ArgumentDefaultsHelpFormatter
 from typing import List, Tuple
 import pprint
@@ -68,13 +69,19 @@ def build_main_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_parser() -> argparse.ArgumentParser:
+    """只构建一次 parser 并复用。parse_known_args 不会修改 parser，多次解析可以共享同一个实例。"""
+    return build_main_parser()
+
+
 # ---------- 演示函数 ----------
 
 def demo_parse(argv: List[str] = None) -> Tuple[argparse.Namespace, List[str]]:
     """解析传入的 argv（若为 None 则解析真实命令行）。
     返回 (known_args_namespace, unknown_args_list)
     """
-    parser = build_main_parser()
+    parser = _cached_parser()
 
     # parse_known_args 将已知参数解析到 args_cli，剩下的放到 hydra_args（或 unknown）
     if argv is None:
@@ -15,13 +15,65 @@ pkgutil.iter_modules / pkgutil.walk_packages 使用示例
 import pkgutil
 import sample_pkg
 import os
+import inspect
+
+
+def fast_iter(path, prefix='', seen=None):
+    """用 os.scandir 递归列出目录下的模块，产出 (name, ispkg)。
+
+    只做文件系统扫描，不经过 finder 机制，也不构造 ModuleInfo；
+    DirEntry 会缓存 is_dir() 的结果，省掉额外的 stat 调用。
+    识别规则参照 pkgutil.iter_modules：用 inspect.getmodulename 识别模块文件
+    （包括 .so 等扩展模块），名字带 '.' 的目录不算包，同名的包和模块只产出一次。
+    """
+    if seen is None:
+        seen = set()
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for e in entries:
+        modname = inspect.getmodulename(e.name)
+        ispkg = False
+        if modname is None:
+            if '.' in e.name or not e.is_dir():
+                continue
+            with os.scandir(e.path) as sub:
+                if not any(inspect.getmodulename(s.name) == '__init__' for s in sub):
+                    continue
+            modname, ispkg = e.name, True
+        if modname == '__init__' or '.' in modname:
+            continue
+        full_name = prefix + modname
+        if full_name in seen:
+            continue
+        seen.add(full_name)
+        yield full_name, ispkg
+        if ispkg:
+            yield from fast_iter(e.path, full_name + '.', seen)
+
+
+def list_modules(pkg):
+    """递归列出包下的所有模块，产出 (name, ispkg)。
+    包位于普通目录时走 fast_iter；否则（zip 等非文件系统 loader）退回 pkgutil.walk_packages。
+    """
+    prefix = pkg.__name__ + '.'
+    if all(os.path.isdir(p) for p in pkg.__path__):
+        seen = set()
+        for p in pkg.__path__:
+            yield from fast_iter(p, prefix, seen)
+    else:
+        for _finder, name, ispkg in pkgutil.walk_packages(pkg.__path__, prefix=prefix):
+            yield name, ispkg
+
 
 print("sample_pkg path:", sample_pkg.__path__)
 print()
 
+# iter_modules 每次调用都会重新扫描目录，下面的示例会用两次，所以先把结果收集起来再复用
+_top_level = list(pkgutil.iter_modules(sample_pkg.__path__))
+
 # ========== 列出 sample_pkg 下的顶级模块（非递归） ==========
 print("Top-level modules under sample_pkg (non-recursive) using pkgutil.iter_modules:")
-for finder, name, ispkg in pkgutil.iter_modules(sample_pkg.__path__):
+for finder, name, ispkg in _top_level:
     print(f"  name={name}, ispkg={ispkg}")
 print()
 
@@ -33,13 +85,13 @@ print()
 
 # ========== 列出发现的顶级模块（不导入，仅显示） ==========
 print("Discovered top-level modules under sample_pkg (non-recursive):")
-for _finder, name, ispkg in pkgutil.iter_modules(sample_pkg.__path__):
+for _finder, name, ispkg in _top_level:
     print(f"  {name} (ispkg={ispkg})")
 print()
 
 # ========== 演示：遍历子包并导入子模块 ==========
-print("Discovered modules under sample_pkg (recursive) (listing only, no import):")
-for _finder, name, ispkg in pkgutil.walk_packages(sample_pkg.__path__, prefix=sample_pkg.__name__ + "."):
+print("Discovered modules under sample_pkg (recursive) (listing only, no import) using os.scandir:")
+for name, ispkg in list_modules(sample_pkg):
     print(f"  {name} (ispkg={ispkg})")
 
 print()